@@ -26,6 +26,22 @@ RATE_RE = re.compile(r"^[+-]?\d+%$")
 PITCH_RE = re.compile(r"^[+-]?\d+Hz$")
 
 
+def _is_signed_int_suffix(value: str, suffix: str) -> bool:
+    """Return True if value looks like an optionally signed integer plus suffix."""
+    if value.startswith(("+", "-")):
+        value = value[1:]
+    if not value.endswith(suffix):
+        return False
+    digits = value[: -len(suffix)]
+    return digits.isascii() and digits.isdigit()
+
+
+def _is_valid(value: Any, suffix: str, pattern: re.Pattern[str]) -> bool:
+    """Check a rate/volume/pitch value, using the regex only as a fallback."""
+    value = str(value)
+    return _is_signed_int_suffix(value, suffix) or pattern.match(value) is not None
+
+
 def _validate_options(user_input: dict[str, Any]) -> dict[str, str]:
     """Validate options and return errors."""
     errors: dict[str, str] = {}
@@ -34,11 +50,11 @@ def _validate_options(user_input: dict[str, Any]) -> dict[str, str]:
     volume = user_input.get(CONF_VOLUME, DEFAULT_VOLUME)
     pitch = user_input.get(CONF_PITCH, DEFAULT_PITCH)
 
-    if rate and not RATE_RE.match(str(rate)):
+    if rate and not _is_valid(rate, "%", RATE_RE):
         errors[CONF_RATE] = "invalid_rate"
-    if volume and not RATE_RE.match(str(volume)):
+    if volume and not _is_valid(volume, "%", RATE_RE):
         errors[CONF_VOLUME] = "invalid_volume"
-    if pitch and not PITCH_RE.match(str(pitch)):
+    if pitch and not _is_valid(pitch, "Hz", PITCH_RE):
         errors[CONF_PITCH] = "invalid_pitch"
 
     return errors
@@ -15,3 +15,11 @@ DEFAULT_VOICE = "en-US-EmmaMultilingualNeural"
 DEFAULT_RATE = "+0%"
 DEFAULT_VOLUME = "+0%"
 DEFAULT_PITCH = "+0Hz"
+
+AUDIO_CACHE_MAX_ENTRIES = 128
+AUDIO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+AUDIO_CACHE_MAX_MESSAGE_LENGTH = 1000
+
+TEMP_FILES_MAX = 32
+TEMP_FILES_MAX_AGE = 600
+TEMP_FILES_SWEEP_INTERVAL = 300
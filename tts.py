@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+import hashlib
 import logging
 import os
 import tempfile
+import time
 from typing import Any
 
 import edge_tts
@@ -24,8 +28,12 @@ from homeassistant.components.media_player import (
     MediaType,
 )
 from homeassistant.components import tts as tts_component
-from homeassistant.const import ATTR_ENTITY_ID, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_HOMEASSISTANT_STOP,
+    EntityCategory,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers import entity_registry as er
@@ -37,6 +45,9 @@ from .const import (
     ATTR_PITCH,
     ATTR_RATE,
     ATTR_VOLUME,
+    AUDIO_CACHE_MAX_BYTES,
+    AUDIO_CACHE_MAX_ENTRIES,
+    AUDIO_CACHE_MAX_MESSAGE_LENGTH,
     CONF_PITCH,
     CONF_RATE,
     CONF_VOICE,
@@ -46,28 +57,52 @@ from .const import (
     DEFAULT_VOICE,
     DEFAULT_VOLUME,
     DOMAIN,
+    TEMP_FILES_MAX,
+    TEMP_FILES_MAX_AGE,
+    TEMP_FILES_SWEEP_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+APPLE_TV_PLATFORM = "apple_tv"
+
+_VOICES_TTL = 6 * 3600
+DATA_VOICES = "voices"
+DATA_VOICES_LOCK = "voices_lock"
 
 def _locale_from_voice(voice: str) -> str:
     """Extract locale from voice short name."""
-    parts = voice.split("-")
-    if len(parts) >= 2:
-        return f"{parts[0]}-{parts[1]}"
-    return "en-US"
+    lang, sep, rest = voice.partition("-")
+    if not sep:
+        return "en-US"
+    region = rest.partition("-")[0]
+    return f"{lang}-{region}" if region else "en-US"
+
+
+async def _async_fetch_voices(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Fetch available voices from Edge TTS, sharing a cached copy."""
+    domain_data: dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    if DATA_VOICES_LOCK not in domain_data:
+        domain_data[DATA_VOICES_LOCK] = asyncio.Lock()
+
+    async with domain_data[DATA_VOICES_LOCK]:
+        cached: tuple[float, list[dict[str, Any]]] | None = domain_data.get(
+            DATA_VOICES
+        )
+        if cached is not None and time.monotonic() - cached[0] < _VOICES_TTL:
+            return cached[1]
 
+        try:
+            voices = await edge_tts.list_voices()
+        except Exception as err:  # noqa: BLE001 - network and API errors are expected
+            _LOGGER.warning("Failed to fetch Edge TTS voices: %s", err)
+            return cached[1] if cached is not None else []
 
-async def _async_fetch_voices() -> list[dict[str, Any]]:
-    """Fetch available voices from Edge TTS."""
-    try:
-        return await edge_tts.list_voices()
-    except Exception as err:  # noqa: BLE001 - network and API errors are expected
-        _LOGGER.warning("Failed to fetch Edge TTS voices: %s", err)
-        return []
+        if voices:
+            domain_data[DATA_VOICES] = (time.monotonic(), voices)
+        return voices
 
 
 async def async_setup_entry(
@@ -76,7 +111,7 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Edge TTS platform via config entry."""
-    voices = await _async_fetch_voices()
+    voices = await _async_fetch_voices(hass)
     config_entry.runtime_data = EdgeTtsData(voices=voices)
 
     async_add_entities([EdgeTTSEntity(config_entry, voices)])
@@ -92,18 +127,26 @@ class EdgeTTSEntity(TextToSpeechEntity):
         """Initialize Edge TTS entity."""
         self._entry = entry
         self._voices = voices
+        self._audio_cache: OrderedDict[bytes, tuple[str, bytes]] = OrderedDict()
+        self._audio_cache_bytes = 0
+        self._temp_files: OrderedDict[str, float] = OrderedDict()
+        self._temp_sweep_unsub: CALLBACK_TYPE | None = None
+        self._stop_unsub: CALLBACK_TYPE | None = None
+        self._removing = False
+        self._voices_by_lang, self._voice_id_for_lang = _build_voice_index(voices)
+
+        resolved = {**entry.data, **entry.options}
+        self._default_voice = str(resolved.get(CONF_VOICE, DEFAULT_VOICE))
+        self._default_rate = str(resolved.get(CONF_RATE, DEFAULT_RATE))
+        self._default_volume = str(resolved.get(CONF_VOLUME, DEFAULT_VOLUME))
+        self._default_pitch = str(resolved.get(CONF_PITCH, DEFAULT_PITCH))
 
-        self._default_voice = self._entry_value(CONF_VOICE, DEFAULT_VOICE)
-        self._default_rate = self._entry_value(CONF_RATE, DEFAULT_RATE)
-        self._default_volume = self._entry_value(CONF_VOLUME, DEFAULT_VOLUME)
-        self._default_pitch = self._entry_value(CONF_PITCH, DEFAULT_PITCH)
-
-        locales = sorted({v.get("Locale") for v in voices if v.get("Locale")})
         default_locale = _locale_from_voice(self._default_voice)
-        if default_locale not in locales:
-            locales.append(default_locale)
-        self._attr_supported_languages = locales
+        locales = {locale for v in voices if (locale := v.get("Locale"))}
+        locales.add(default_locale)
+        self._attr_supported_languages = sorted(locales)
         self._attr_default_language = default_locale
+        self._default_locale_lc = default_locale.lower()
 
         self._attr_default_options = {
             ATTR_VOICE: self._default_voice,
@@ -125,20 +168,7 @@ class EdgeTTSEntity(TextToSpeechEntity):
         if not self._voices:
             return None
 
-        language = language.lower()
-        voices = [
-            voice
-            for voice in self._voices
-            if voice.get("Locale", "").lower().startswith(language)
-            or voice.get("Locale", "").split("-")[0].lower() == language
-        ]
-        return [
-            Voice(
-                voice_id=voice["ShortName"],
-                name=voice.get("FriendlyName") or voice.get("Name") or voice["ShortName"],
-            )
-            for voice in voices
-        ]
+        return list(self._voices_by_lang.get(language.lower(), ()))
 
     async def async_get_tts_audio(
         self, message: str, language: str, options: dict[str, Any]
@@ -153,29 +183,40 @@ class EdgeTTSEntity(TextToSpeechEntity):
         rate = options.get(ATTR_RATE, self._default_rate)
         volume = options.get(ATTR_VOLUME, self._default_volume)
         pitch = options.get(ATTR_PITCH, self._default_pitch)
+
+        cache_key = _audio_cache_key(message, voice, rate, volume, pitch)
+        if (cached := self._audio_cache.get(cache_key)) is not None:
+            self._audio_cache.move_to_end(cache_key)
+            return cached
+
         try:
+            # Only the defaults are guaranteed to be str; values passed in by
+            # service callers are unchecked, and invalid ones are rejected by
+            # edge_tts and surfaced through the except below.
             communicate = edge_tts.Communicate(
                 message,
                 voice,
-                rate=str(rate),
-                volume=str(volume),
-                pitch=str(pitch),
+                rate=rate,
+                volume=volume,
+                pitch=pitch,
             )
-            audio_chunks: list[bytes] = []
+            buf = bytearray()
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
-                    audio_chunks.append(chunk["data"])
+                    buf.extend(chunk["data"])
 
-            if not audio_chunks:
+            if not buf:
                 raise HomeAssistantError("No audio received from Edge TTS")
 
-            audio_bytes = b"".join(audio_chunks)
-            audio_bytes = _strip_id3v2(audio_bytes)
-            return "mp3", audio_bytes
+            audio_bytes = bytes(buf)
         except Exception as err:  # noqa: BLE001 - surface the error to the user
             _LOGGER.warning("Edge TTS request failed: %s", err, exc_info=True)
             raise HomeAssistantError("Edge TTS request failed") from err
 
+        if len(message) <= AUDIO_CACHE_MAX_MESSAGE_LENGTH:
+            self._cache_audio(cache_key, ("mp3", audio_bytes))
+        return "mp3", audio_bytes
+
     async def async_speak(
         self,
         media_player_entity_id: list[str],
@@ -205,7 +246,10 @@ class EdgeTTSEntity(TextToSpeechEntity):
         if not extension or not audio_bytes:
             raise HomeAssistantError("No audio received from Edge TTS")
 
-        file_path = self._write_temp_audio(audio_bytes, extension)
+        # Apple TV plays the local file directly and may choke on ID3 tags.
+        file_path = await self.hass.async_add_executor_job(
+            _write_temp_audio, _strip_id3v2(audio_bytes), extension
+        )
         await self.hass.services.async_call(
             DOMAIN_MP,
             SERVICE_PLAY_MEDIA,
@@ -218,80 +262,193 @@ class EdgeTTSEntity(TextToSpeechEntity):
             blocking=True,
             context=self._context,
         )
-        self._schedule_temp_cleanup(file_path)
+        self._track_temp_file(file_path)
 
-    def _voice_for_language(self, language: str) -> str | None:
-        """Pick the first voice matching the requested language."""
-        if not self._voices:
-            return None
+    async def async_added_to_hass(self) -> None:
+        """Clean up temp files when Home Assistant stops."""
+        await super().async_added_to_hass()
+        self._stop_unsub = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_on_stop
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop tracking temp files and remove any remaining ones."""
+        self._removing = True
+        if self._stop_unsub is not None:
+            self._stop_unsub()
+            self._stop_unsub = None
+        await self._async_remove_temp_files()
+
+    async def _async_on_stop(self, _: Event) -> None:
+        """Remove remaining temp files on shutdown."""
+        self._stop_unsub = None
+        self._removing = True
+        await self._async_remove_temp_files()
+
+    async def _async_remove_temp_files(self) -> None:
+        """Cancel the temp file sweep and delete every tracked file."""
+        if self._temp_sweep_unsub is not None:
+            self._temp_sweep_unsub()
+            self._temp_sweep_unsub = None
+        if self._temp_files:
+            paths = list(self._temp_files)
+            self._temp_files.clear()
+            await self.hass.async_add_executor_job(_remove_files, paths)
 
+    def _voice_for_language(self, language: str) -> str | None:
+        """Pick the default voice or the first voice matching the language."""
         language = language.lower()
-        for voice in self._voices:
-            locale = voice.get("Locale", "").lower()
-            if locale.startswith(language) or locale.split("-")[0] == language:
-                return voice.get("ShortName")
-        return None
-
-    def _entry_value(self, key: str, default: str) -> str:
-        """Return option value, falling back to entry data and defaults."""
-        if key in self._entry.options:
-            return str(self._entry.options[key])
-        if key in self._entry.data:
-            return str(self._entry.data[key])
-        return default
+        if language == self._default_locale_lc:
+            return self._default_voice
+        return self._voice_id_for_lang.get(language)
+
+    def _cache_audio(self, key: bytes, audio: tuple[str, bytes]) -> None:
+        """Store synthesized audio, evicting least recently used entries."""
+        if len(audio[1]) > AUDIO_CACHE_MAX_BYTES:
+            return
+
+        cache = self._audio_cache
+        if (previous := cache.pop(key, None)) is not None:
+            self._audio_cache_bytes -= len(previous[1])
+        cache[key] = audio
+        self._audio_cache_bytes += len(audio[1])
+
+        while cache and (
+            len(cache) > AUDIO_CACHE_MAX_ENTRIES
+            or self._audio_cache_bytes > AUDIO_CACHE_MAX_BYTES
+        ):
+            _, (_, evicted) = cache.popitem(last=False)
+            self._audio_cache_bytes -= len(evicted)
 
     def _split_media_players(self, entity_ids: list[str]) -> tuple[list[str], list[str]]:
         """Split media players into Apple TV and others."""
         if not entity_ids:
             return [], []
 
-        registry = er.async_get(self.hass)
+        get_entry = er.async_get(self.hass).async_get
         apple_tv_ids: list[str] = []
         other_ids: list[str] = []
 
         for entity_id in entity_ids:
-            entry = registry.async_get(entity_id)
-            if entry and entry.platform == "apple_tv":
+            entry = get_entry(entity_id)
+            if entry and entry.platform == APPLE_TV_PLATFORM:
                 apple_tv_ids.append(entity_id)
             else:
                 other_ids.append(entity_id)
 
         return apple_tv_ids, other_ids
 
-    def _write_temp_audio(self, audio_bytes: bytes, extension: str) -> str:
-        """Write audio to a temporary file and return the path."""
-        tmp = tempfile.NamedTemporaryFile(
-            mode="wb", suffix=f".{extension}", delete=False
+    def _track_temp_file(self, path: str) -> None:
+        """Remember a temp audio file, evicting the oldest beyond the limit."""
+        if self._removing:
+            self.hass.async_add_executor_job(_remove_files, [path])
+            return
+
+        self._temp_files[path] = time.monotonic()
+
+        evicted: list[str] = []
+        while len(self._temp_files) > TEMP_FILES_MAX:
+            evicted.append(self._temp_files.popitem(last=False)[0])
+        if evicted:
+            self.hass.async_add_executor_job(_remove_files, evicted)
+
+        if self._temp_sweep_unsub is None:
+            self._temp_sweep_unsub = async_call_later(
+                self.hass, TEMP_FILES_SWEEP_INTERVAL, self._async_sweep_temp_files
+            )
+
+    @callback
+    def _async_sweep_temp_files(self, _: Any) -> None:
+        """Remove expired temp audio files and re-arm while any remain."""
+        self._temp_sweep_unsub = None
+
+        cutoff = time.monotonic() - TEMP_FILES_MAX_AGE
+        expired: list[str] = []
+        for path, created in self._temp_files.items():
+            if created > cutoff:
+                break
+            expired.append(path)
+        for path in expired:
+            del self._temp_files[path]
+        if expired:
+            self.hass.async_add_executor_job(_remove_files, expired)
+
+        if self._temp_files:
+            self._temp_sweep_unsub = async_call_later(
+                self.hass, TEMP_FILES_SWEEP_INTERVAL, self._async_sweep_temp_files
+            )
+
+
+def _build_voice_index(
+    voices: list[dict[str, Any]],
+) -> tuple[dict[str, list[Voice]], dict[str, str]]:
+    """Index voices by every hyphen-delimited prefix of their lowercased locale."""
+    voices_by_lang: dict[str, list[Voice]] = {}
+    voice_id_for_lang: dict[str, str] = {}
+
+    for voice in voices:
+        locale = voice.get("Locale", "").lower()
+        entry = Voice(
+            voice_id=voice["ShortName"],
+            name=voice.get("FriendlyName") or voice.get("Name") or voice["ShortName"],
         )
-        with tmp:
-            tmp.write(audio_bytes)
-        return tmp.name
+        key = ""
+        for part in locale.split("-"):
+            key = f"{key}-{part}" if key else part
+            voices_by_lang.setdefault(key, []).append(entry)
+            voice_id_for_lang.setdefault(key, entry.voice_id)
+
+    return voices_by_lang, voice_id_for_lang
+
 
-    def _schedule_temp_cleanup(self, path: str, delay: int = 600) -> None:
-        """Schedule deletion of a temporary audio file."""
+def _write_temp_audio(audio_bytes: bytes, extension: str) -> str:
+    """Write audio to a temporary file and return the path."""
+    fd, path = tempfile.mkstemp(suffix=f".{extension}")
+    try:
+        view = memoryview(audio_bytes)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    return path
+
+
+def _remove_files(paths: list[str]) -> None:
+    """Delete temporary audio files, ignoring ones that are already gone."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError as err:
+            _LOGGER.debug("Failed to remove temp TTS file %s: %s", path, err)
 
-        async def _cleanup(_: Any) -> None:
-            try:
-                os.remove(path)
-            except OSError as err:
-                _LOGGER.debug("Failed to remove temp TTS file %s: %s", path, err)
 
-        async_call_later(self.hass, delay, _cleanup)
+def _audio_cache_key(
+    message: str, voice: str, rate: Any, volume: Any, pitch: Any
+) -> bytes:
+    """Build a compact cache key for a synthesis request."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (voice, rate, volume, pitch, message):
+        digest.update(str(part).encode())
+        digest.update(b"\0")
+    return digest.digest()
 
 
 def _strip_id3v2(data: bytes) -> bytes:
     """Remove ID3v2 tag from MP3 bytes if present."""
-    if len(data) < 10 or not data.startswith(b"ID3"):
+    if len(data) < 10 or data[:3] != b"ID3":
         return data
 
     # ID3v2 header: "ID3" + ver(2) + flags(1) + size(4, synchsafe)
-    size_bytes = data[6:10]
-    size = 0
-    for b in size_bytes:
-        size = (size << 7) | (b & 0x7F)
+    n = int.from_bytes(data[6:10], "big")
+    size = (
+        ((n & 0x7F000000) >> 3)
+        | ((n & 0x7F0000) >> 2)
+        | ((n & 0x7F00) >> 1)
+        | (n & 0x7F)
+    )
 
     total = 10 + size
     if total >= len(data):
         return data
     _LOGGER.debug("Stripping ID3v2 tag of %s bytes", size)
-    return data[total:]
+    return memoryview(data)[total:].tobytes()